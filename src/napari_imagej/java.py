@@ -13,7 +13,6 @@ Notable fields included in the module:
 from logging import getLogger
 from typing import Any, Dict
 
-import imagej
 from scyjava import JavaClasses, config, get_version, is_version_at_least, jimport
 
 from napari_imagej import settings
@@ -70,6 +69,11 @@ def init_ij() -> "jc.ImageJ":
 
     # -- INITIALIZATION -- #
 
+    # NB: PyImageJ is imported here, rather than at the top of the module, so that
+    # importing napari-imagej (e.g. during napari plugin discovery) does not pay
+    # for it until ImageJ2 is actually needed.
+    import imagej
+
     # Launch ImageJ
     ij = (
         imagej.gateway
@@ -124,17 +128,13 @@ def _validate_imagej(ij: "jc.ImageJ") -> None:
     # If we want to require a minimum version for a java component, we need to
     # be able to find our current version. We do that by querying a Java class
     # within that component.
-    ImageJ = jimport("net.imagej.Main")
-    RGRAI = jimport("net.imglib2.python.ReferenceGuardingRandomAccessibleInterval")
-    SCIFIO = jimport("io.scif.SCIFIO")
-    UnsafeImg = jimport("net.imglib2.img.unsafe.UnsafeImg")
     class_from = {
-        "io.scif:scifio": SCIFIO,
-        "net.imagej:imagej": ImageJ,
+        "io.scif:scifio": jc.SCIFIO,
+        "net.imagej:imagej": jc.ImageJMain,
         "net.imagej:imagej-common": jc.Dataset,
         "net.imagej:imagej-ops": jc.OpInfo,
-        "net.imglib2:imglib2-unsafe": UnsafeImg,
-        "net.imglib2:imglib2-imglyb": RGRAI,
+        "net.imglib2:imglib2-unsafe": jc.UnsafeImg,
+        "net.imglib2:imglib2-imglyb": jc.ReferenceGuardingRandomAccessibleInterval,
         "org.scijava:scijava-common": jc.Module,
         "org.scijava:scijava-search": jc.Searcher,
     }
@@ -416,6 +416,10 @@ class NijJavaClasses(JavaClasses):
     def SearchResult(self):
         return "org.scijava.search.SearchResult"
 
+    @JavaClasses.java_import
+    def SearchService(self):
+        return "org.scijava.search.SearchService"
+
     @JavaClasses.java_import
     def Table(self):
         return "org.scijava.table.Table"
@@ -532,6 +536,14 @@ class NijJavaClasses(JavaClasses):
     def RealType(self):
         return "net.imglib2.type.numeric.RealType"
 
+    @JavaClasses.java_import
+    def ReferenceGuardingRandomAccessibleInterval(self):
+        return "net.imglib2.python.ReferenceGuardingRandomAccessibleInterval"
+
+    @JavaClasses.java_import
+    def UnsafeImg(self):
+        return "net.imglib2.img.unsafe.UnsafeImg"
+
     # ImgLib2-algorithm Types
 
     @JavaClasses.java_import
@@ -662,6 +674,10 @@ class NijJavaClasses(JavaClasses):
     def ImageJ(self):
         return "net.imagej.ImageJ"
 
+    @JavaClasses.java_import
+    def ImageJMain(self):
+        return "net.imagej.Main"
+
     @JavaClasses.java_import
     def ImgPlus(self):
         return "net.imagej.ImgPlus"
@@ -714,5 +730,11 @@ class NijJavaClasses(JavaClasses):
     def LabelingIOService(self):
         return "io.scif.labeling.LabelingIOService"
 
+    # SCIFIO Types
+
+    @JavaClasses.java_import
+    def SCIFIO(self):
+        return "io.scif.SCIFIO"
+
 
 jc = NijJavaClasses()
@@ -10,6 +10,7 @@ class NapariImageJ:
 
     def __init__(self):
         self._ij = None
+        self._search_service = None
         self._repl = None
         self._repl_callbacks = []
 
@@ -19,6 +20,12 @@ class NapariImageJ:
             self._ij = init_ij()
         return self._ij
 
+    @property
+    def search_service(self) -> "jc.SearchService":
+        if self._search_service is None:
+            self._search_service = self.ij.get("org.scijava.search.SearchService")
+        return self._search_service
+
     @property
     def repl(self) -> "jc.ScriptREPL":
         if self._repl is None:
@@ -88,10 +88,10 @@ def basedir() -> str:
     Get the validated, guaranteed-to-exist ImageJ base directory.
     """
     abs_basedir = os.path.abspath(imagej_base_directory)
-    if not os.path.exists(abs_basedir):
+    if not os.path.isdir(abs_basedir):
         cwd = os.getcwd()
         getLogger("napari-imagej").warning(
-            f"Non-existent base directory '{abs_basedir}'; "
+            f"Invalid base directory '{abs_basedir}'; "
             f"falling back to current working directory '{cwd}'"
         )
         abs_basedir = cwd
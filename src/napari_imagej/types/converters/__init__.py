@@ -89,14 +89,22 @@ for loader, module_name, is_pkg in pkgutil.walk_packages(__path__):
 
 # PHASE 3 - INSTALL ALL CONVERTERS
 
+_converters_installed = False
+
 
 def install_converters():
     """Installs napari-imagej specific converters"""
+    global _converters_installed
+    # NB registering twice would install each converter twice,
+    # slowing down every subsequent conversion.
+    if _converters_installed:
+        return
+    _converters_installed = True
+    when_jvm_starts(_install_converters)
 
-    def _install_converters():
-        for converter in JAVA_TO_PY_CONVERTERS:
-            add_py_converter(converter)
-        for converter in PY_TO_JAVA_CONVERTERS:
-            add_java_converter(converter)
 
-    when_jvm_starts(_install_converters)
+def _install_converters():
+    for converter in JAVA_TO_PY_CONVERTERS:
+        add_py_converter(converter)
+    for converter in PY_TO_JAVA_CONVERTERS:
+        add_java_converter(converter)
@@ -144,7 +144,7 @@ def _image_layer_to_dataset(image: Image, **kwargs) -> "jc.Dataset":
             properties.put(nij.ij.py.to_java(k), nij.ij.py.to_java(v))
         except Exception:
             getLogger("napari-imagej").debug(
-                f"Could not add property ({k}, {v}) to dataset {dataset}:"
+                "Could not add property (%s, %s) to dataset %s:", k, v, dataset
             )
     return dataset
 
@@ -17,7 +17,8 @@ Notable functions included in the module:
         - determines an "equivalent" python type for a given SciJava ModuleItem
 """
 
-from typing import Callable, List, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from jpype import JObject
 from scyjava import Priority
@@ -26,12 +27,15 @@ from napari_imagej import nij
 from napari_imagej.java import jc
 from napari_imagej.types.enum_likes import enum_like
 from napari_imagej.types.enums import py_enum_for
-from napari_imagej.types.type_hints import type_hints
+from napari_imagej.types.type_hints import TypeHint, type_hints
 from napari_imagej.widgets.parameter_widgets import widget_supported_java_types
 
-# List of Module Item Converters, along with their priority
+# List of Module Item Converters, along with their priority, sorted by priority
 _MODULE_ITEM_CONVERTERS: List[Tuple[Callable, int]] = []
 
+# Cache of type hints, keyed on the ModuleItem properties the converters inspect
+_TYPE_HINT_CACHE: Dict[Tuple[Any, bool, bool, bool], Any] = {}
+
 
 def module_item_converter(
     priority: int = Priority.NORMAL,
@@ -46,6 +50,9 @@ def module_item_converter(
     def converter(func: Callable):
         """Registers the annotated function with its priority"""
         _MODULE_ITEM_CONVERTERS.append((func, priority))
+        # NB keep the converters sorted by priority, rather than sorting per call.
+        # The sort is stable, so converters of equal priority keep their order.
+        _MODULE_ITEM_CONVERTERS.sort(reverse=True, key=lambda x: x[1])
         return func
 
     return converter
@@ -53,12 +60,20 @@ def module_item_converter(
 
 def type_hint_for(module_item: "jc.ModuleItem"):
     """Returns a python type hint for the passed Java ModuleItem."""
-    for converter, _ in sorted(
-        _MODULE_ITEM_CONVERTERS, reverse=True, key=lambda x: x[1]
-    ):
-        converted = converter(module_item)
-        if converted is not None:
-            return converted
+    # NB the converters only depend upon these properties, so items agreeing
+    # on all of them will always resolve to the same hint. Caching the result
+    # saves many JNI calls, as many modules share parameter types.
+    key = (
+        module_item.getType(),
+        bool(module_item.isInput()),
+        bool(module_item.isOutput()),
+        bool(module_item.isRequired()),
+    )
+    if key not in _TYPE_HINT_CACHE:
+        _TYPE_HINT_CACHE[key] = _compute_type_hint(module_item)
+    hint = _TYPE_HINT_CACHE[key]
+    if hint is not None:
+        return hint
     raise ValueError(
         (
             f"Cannot determine python type hint of {module_item.getType()}. "
@@ -68,6 +83,15 @@ def type_hint_for(module_item: "jc.ModuleItem"):
     )
 
 
+def _compute_type_hint(module_item: "jc.ModuleItem"):
+    """Returns the first type hint produced by the converters, or None."""
+    for converter, _ in _MODULE_ITEM_CONVERTERS:
+        converted = converter(module_item)
+        if converted is not None:
+            return converted
+    return None
+
+
 def _optional_of(p_type: type, item: "jc.ModuleItem") -> type:
     if not p_type:
         return p_type
@@ -142,21 +166,22 @@ def _checkerUsingFunc(
     """
     # Get the type of the Module item
     java_type = item.getType()
+    is_input, is_output = item.isInput(), item.isOutput()
     # Case 1
-    if item.isInput() and not item.isOutput():
+    if is_input and not is_output:
         for hint in type_hints():
             # can we go from hint.type to java_type?
             if func(hint.type, java_type):
                 return _optional_of(hint.hint, item)
     # Case 2
-    elif item.isOutput() and not item.isInput():
+    elif is_output and not is_input:
         # NB type_pairs is ordered from least to most specific.
         for hint in type_hints():
             # can we go from java_type to hint.type?
             if func(java_type, hint.type):
                 return _optional_of(hint.hint, item)
     # Case 3
-    elif item.isInput() and item.isOutput():
+    elif is_input and is_output:
         for hint in type_hints():
             # can we go both ways?
             if func(hint.type, java_type) and func(java_type, hint.type):
@@ -166,19 +191,39 @@ def _checkerUsingFunc(
     return None
 
 
+@lru_cache(maxsize=None)
+def _raw_type(java_type) -> "jc.Class":
+    """
+    Returns the raw Class of java_type.
+    NB the same few type hint types are checked for every ModuleItem,
+    so caching saves many redundant calls into Java.
+    """
+    return jc.Types.raw(java_type)
+
+
+@lru_cache(maxsize=None)
+def _type_hints_by_raw_name() -> Dict[str, TypeHint]:
+    """
+    Returns the first TypeHint of each raw Java type, keyed by class name.
+    """
+    hints: Dict[str, TypeHint] = {}
+    for hint in type_hints():
+        hints.setdefault(str(_raw_type(hint.type).getName()), hint)
+    return hints
+
+
 @module_item_converter(priority=Priority.HIGH)
 def isEqualChecker(item: "jc.ModuleItem") -> Optional[Type]:
     """
     Determines whether we have a type hint for this SPECIFIC type.
     """
-
-    def isAssignable(from_type, to_type) -> bool:
-        # Use Types to get the raw type of each
-        from_raw = jc.Types.raw(from_type)
-        to_raw = jc.Types.raw(to_type)
-        return to_raw.equals(from_raw)
-
-    return _checkerUsingFunc(item, isAssignable)
+    # NB Type equality is symmetric, so all three cases of _checkerUsingFunc
+    # reduce to finding the first hint of the same raw type - a dict lookup.
+    if not item.isInput() and not item.isOutput():
+        return None
+    raw_name = str(_raw_type(item.getType()).getName())
+    hint = _type_hints_by_raw_name().get(raw_name)
+    return _optional_of(hint.hint, item) if hint else None
 
 
 @module_item_converter()
@@ -189,8 +234,8 @@ def isAssignableChecker(item: "jc.ModuleItem") -> Optional[Type]:
 
     def isAssignable(from_type, to_type) -> bool:
         # Use Types to get the raw type of each
-        from_raw = jc.Types.raw(from_type)
-        to_raw = jc.Types.raw(to_type)
+        from_raw = _raw_type(from_type)
+        to_raw = _raw_type(to_type)
         return to_raw.isAssignableFrom(from_raw)
 
     return _checkerUsingFunc(item, isAssignable)
@@ -202,7 +247,10 @@ def canConvertChecker(item: "jc.ModuleItem") -> Optional[Type]:
     Determines whether imagej can do a conversion from ptype to item's type java_type.
     """
 
+    # NB fetch the ConvertService once, rather than once per TypeHint
+    convert = nij.ij.convert()
+
     def isAssignable(from_type, to_type) -> bool:
-        return nij.ij.convert().supports(from_type, to_type)
+        return convert.supports(from_type, to_type)
 
     return _checkerUsingFunc(item, isAssignable)
@@ -2,9 +2,12 @@
 A module containing useful functions for operating on python types
 """
 
+from functools import lru_cache
+
 from napari_imagej.types import type_hints
 
 
+@lru_cache(maxsize=None)
 def _napari_layer_types():
     """A hardcoded set of types that should be displayable in napari"""
     layer_hints = [
@@ -15,14 +18,15 @@ def _napari_layer_types():
         *type_hints.labels(),
     ]
 
-    return list(map(lambda hint: hint.type, layer_hints))
+    # NB a tuple, so it can be passed straight to isinstance/issubclass
+    return tuple(hint.type for hint in layer_hints)
 
 
 def displayable_in_napari(data):
     """Determines whether data should be displayable in napari"""
-    return any(filter(lambda x: isinstance(data, x), _napari_layer_types()))
+    return isinstance(data, _napari_layer_types())
 
 
 def type_displayable_in_napari(type):
     """Determines whether an object of the given type could be displayed in napari"""
-    return any(filter(lambda x: issubclass(type, x), _napari_layer_types()))
+    return issubclass(type, _napari_layer_types())
@@ -69,8 +69,9 @@ def preferred_widget_for(
 def _numeric_type_preference(
     item: "jc.ModuleItem", type_hint: Union[type, str]
 ) -> Optional[Union[type, str]]:
-    if issubclass(item.getType(), jc.NumericType):
-        return numeric_type_widget_for(item.getType())
+    item_type = item.getType()
+    if issubclass(item_type, jc.NumericType):
+        return numeric_type_widget_for(item_type)
     return None
 
 
@@ -78,23 +79,24 @@ def _numeric_type_preference(
 def _number_preference(
     item: "jc.ModuleItem", type_hint: Union[type, str]
 ) -> Optional[Union[type, str]]:
+    item_type = item.getType()
     # Primitives
-    if item.getType() == JByte:
+    if item_type == JByte:
         return number_widget_for(jc.Byte)
-    if item.getType() == JShort:
+    if item_type == JShort:
         return number_widget_for(jc.Short)
-    if item.getType() == JInt:
+    if item_type == JInt:
         return number_widget_for(jc.Integer)
-    if item.getType() == JLong:
+    if item_type == JLong:
         return number_widget_for(jc.Long)
-    if item.getType() == JFloat:
+    if item_type == JFloat:
         return number_widget_for(jc.Float)
-    if item.getType() == JDouble:
+    if item_type == JDouble:
         return number_widget_for(jc.Double)
 
     # Boxed primitives
-    if issubclass(item.getType(), jc.Number):
-        return number_widget_for(item.getType())
+    if issubclass(item_type, jc.Number):
+        return number_widget_for(item_type)
     return None
 
 
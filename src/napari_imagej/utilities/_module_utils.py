@@ -11,12 +11,13 @@ There are a few functions that are designed for use by graphical widgets, namely
         - converts a SciJava SearchResult to a ModuleInfo
 """
 
+from functools import lru_cache
 from inspect import Parameter, Signature, _empty, isclass, signature
-from logging import getLogger
+from logging import DEBUG, getLogger
 from time import perf_counter
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from jpype import JException, JImplements, JOverride
+from jpype import JException, JImplements, JOverride, JString
 from magicgui.widgets import Container, Label, LineEdit, Table, Widget, request_values
 from napari.layers import Layer
 from napari.utils._magicgui import get_layers
@@ -44,13 +45,25 @@ def _preprocess_to_harvester(module) -> List["jc.PreprocessorPlugin"]:
     :return: The list of preprocessors that have not yet run.
     """
 
-    preprocessors = nij.ij.plugin().createInstancesOfType(jc.PreprocessorPlugin)
+    preprocessors = nij.ij.plugin().createInstances(_preprocessor_infos())
     for i, preprocessor in enumerate(preprocessors):
         # if preprocessor is an InputHarvester, stop and return the remaining list
         if isinstance(preprocessor, jc.InputHarvester):
             return preprocessors.subList(i, preprocessors.size())
         # preprocess
         preprocessor.process(module)
+    # No InputHarvesters - all preprocessors have run
+    return jc.ArrayList()
+
+
+@lru_cache(maxsize=None)
+def _preprocessor_infos() -> List["jc.PluginInfo"]:
+    """
+    Returns the PluginInfos of all PreprocessorPlugins, sorted by priority.
+    NB the PluginService must filter its entire plugin index to find these,
+    so we only do that once. Fresh instances are still created per module.
+    """
+    return nij.ij.plugin().getPluginsOfType(jc.PreprocessorPlugin)
 
 
 NAPARI_IMAGEJ_PREPROCESSORS: List[Callable[["jc.Module"], None]] = []
@@ -67,10 +80,8 @@ def optional_preallocated_output_real_type_preprocessor(module: "jc.Module"):
     Optional Preallocated RealType Outputs are annoying, since we can't resolve them
     in napari. So we resolve them here
     """
+    # NB cheapest (and most selective) checks come first
     for input in module.getInfo().inputs():
-        # We don't care about resolved inputs
-        if module.isInputResolved(input.getName()):
-            continue
         # We don't care about pure inputs
         if not input.isOutput():
             continue
@@ -78,8 +89,12 @@ def optional_preallocated_output_real_type_preprocessor(module: "jc.Module"):
         if input.isRequired():
             continue
         # We only care about RealType/Number inputs
-        if issubclass(input.getType(), (jc.RealType, jc.Number)):
-            module.resolveInput(input.getName())
+        if not issubclass(input.getType(), (jc.RealType, jc.Number)):
+            continue
+        # We don't care about resolved inputs
+        name = input.getName()
+        if not module.isInputResolved(name):
+            module.resolveInput(name)
 
 
 def _preprocess_napari_imagej(module: "jc.Module"):
@@ -130,12 +145,13 @@ def _filter_unresolved_inputs(
     module: "jc.Module", inputs: List["jc.ModuleItem"]
 ) -> List["jc.ModuleItem"]:
     """Returns a list of all inputs that can only be resolved by the user."""
-    # Grab all unresolved inputs
-    unresolved = list(filter(lambda i: not module.isResolved(i.getName()), inputs))
-    # Only leave in the optional parameters that we know how to resolve
-    unresolved = list(filter(_resolvable_or_required, unresolved))
-
-    return unresolved
+    # Grab all unresolved inputs,
+    # only leaving in the optional parameters that we know how to resolve
+    return [
+        i
+        for i in inputs
+        if not module.isResolved(i.getName()) and _resolvable_or_required(i)
+    ]
 
 
 # Credit: https://gist.github.com/xhlulu/95118e225b7a1aa806e696180a72bdd0
@@ -156,6 +172,8 @@ def _napari_module_param_additions(
     for output_item in module_info.outputs():
         if not type_displayable_in_napari(output_item.getType()):
             additional_params["display_results_in_new_window"] = (bool, False)
+            # One such output is enough - no need to inspect the rest
+            break
     return additional_params
 
 
@@ -174,11 +192,11 @@ def _sink_optional_inputs(inputs: List["jc.ModuleItem"]) -> List["jc.ModuleItem"
     Python functions cannot have required args after an optional arg.
     We need to move all optional inputs after the required ones.
     """
-
-    def sort_key(x):
-        return -1 if _is_required_arg(x) else 1
-
-    return sorted(inputs, key=sort_key)
+    # NB a stable partition suffices - no need to sort
+    required, optional = [], []
+    for input in inputs:
+        (required if _is_required_arg(input) else optional).append(input)
+    return required + optional
 
 
 def _param_default_or_none(input: "jc.ModuleItem") -> Optional[Any]:
@@ -191,18 +209,23 @@ def _param_default_or_none(input: "jc.ModuleItem") -> Optional[Any]:
         # Parameter uses an internal type to denote a required parameter.
         return _empty
     try:
-        return nij.ij.py.from_java(default)
+        return _metadata_from_java(default)
     except Exception:
         return default
 
 
-def _module_param(input: "jc.ModuleItem") -> Parameter:
-    """Converts a java ModuleItem into a python Parameter"""
-    name = str(input.getName())
+def _python_param_name(name: str) -> str:
+    """Converts a ModuleItem name into a valid python Parameter name"""
     if name == "in":
         # HACK: The name "in" is a keyword in Python.
         # So we use the name "input" instead.
-        name = "input"
+        return "input"
+    return name
+
+
+def _module_param(input: "jc.ModuleItem") -> Parameter:
+    """Converts a java ModuleItem into a python Parameter"""
+    name = _python_param_name(str(input.getName()))
     kind = Parameter.POSITIONAL_OR_KEYWORD
     default = _param_default_or_none(input)
     type_hint = type_hint_for(input)
@@ -217,7 +240,6 @@ def _modify_function_signature(
 ) -> None:
     """Rewrites function with type annotations for all module I/O items."""
 
-    sig: Signature = signature(function)
     # Grab all options after the module inputs
     inputs = _sink_optional_inputs(inputs)
     module_params = [_module_param(i) for i in inputs]
@@ -231,7 +253,14 @@ def _modify_function_signature(
         for i in _napari_module_param_additions(module_info).items()
     ]
     all_params = module_params + other_params
-    function.__signature__ = sig.replace(parameters=all_params)
+    # NB we replace every parameter, so there is no need to introspect function
+    # with inspect.signature - only its return annotation is retained.
+    function.__signature__ = Signature(
+        parameters=all_params,
+        return_annotation=function.__annotations__.get("return", Signature.empty),
+    )
+    # Cache each parameter's position, for quick lookup upon each execution
+    function._param_index = {p.name: i for i, p in enumerate(all_params)}
 
 
 def _devise_layer_name(info: "jc.ModuleInfo", original_name: str) -> str:
@@ -281,7 +310,7 @@ def _handle_output(
         for i, value in enumerate(output):
             if not isinstance(value, Layer):
                 getLogger("napari-imagej").debug(
-                    f"Skipping output {value}: part of a list with images inside"
+                    "Skipping output %s: part of a list with images inside", value
                 )
                 continue
             sub_name = f"{name}_{i}" if len(output) > 1 else name
@@ -306,19 +335,21 @@ def _pure_module_outputs(
     # Partition outputs into layer and widget outputs
     info = module.getInfo()
     outputs = module.getOutputs()
+    user_input_names = {str(i.getName()) for i in user_inputs}
     for output_entry in outputs.entrySet():
+        value = output_entry.getValue()
         # Ignore None outputs
-        if output_entry.getValue() is None:
+        if value is None:
             continue
         # Get relevant output parameters
         name = str(output_entry.getKey())
         # If the layer was also an input, it came from a napari layer. We
         # don't want duplicate layers, so skip this one.
-        if info.getInput(name) in user_inputs and module.getInput(name):
+        if name in user_input_names and module.getInput(name):
             continue
 
         _handle_output(
-            nij.ij.py.from_java(output_entry.getValue()),
+            nij.ij.py.from_java(value),
             _devise_layer_name(info, name),
             info,
             layer_outputs,
@@ -330,9 +361,12 @@ def _pure_module_outputs(
 
 
 def _napari_specific_parameter(func: Callable, args: Tuple[Any], param: str) -> Any:
-    try:
-        index = list(signature(func).parameters.keys()).index(param)
-    except ValueError:
+    # NB functions from _modify_function_signature carry a precomputed index
+    param_index = getattr(func, "_param_index", None)
+    if param_index is None:
+        param_index = {p: i for i, p in enumerate(signature(func).parameters)}
+    index = param_index.get(param)
+    if index is None:
         return None
 
     return args[index]
@@ -362,7 +396,7 @@ def _add_napari_metadata(
     info: "jc.ModuleInfo",
     unresolved_inputs: List["jc.ModuleItem"],
 ) -> None:
-    module_name = nij.ij.py.from_java(info.getTitle())
+    module_name = str(info.getTitle())
     execute_module.__doc__ = f"Invoke ImageJ2's {module_name}"
     execute_module.__name__ = module_name
     execute_module.__qualname__ = module_name
@@ -372,12 +406,27 @@ def _add_napari_metadata(
 
     # Add the type hints as annotations metadata as well.
     # Without this, magicgui doesn't pick up on the types.
-    type_hints = {str(i.getName()): type_hint_for(i) for i in unresolved_inputs}
+    # NB the new signature already holds each parameter's type hint
+    sig: Signature = execute_module.__signature__
+    type_hints = {p.name: p.annotation for p in sig.parameters.values()}
 
-    type_hints["return"] = signature(execute_module).return_annotation
+    type_hints["return"] = sig.return_annotation
 
     execute_module._info = info  # type: ignore
-    execute_module.__annotation__ = type_hints  # type: ignore
+    execute_module.__annotations__ = type_hints
+
+
+def _metadata_from_java(value: Any) -> Any:
+    """
+    Converts a ModuleItem metadata value to Python, avoiding a call to
+    from_java (and its converter lookup) for values that are trivially Python.
+    """
+    # NB exact type checks - JPype boxed primitives subclass int/float
+    if type(value) in (bool, int, float, str):
+        return value
+    if isinstance(value, JString):
+        return str(value)
+    return nij.ij.py.from_java(value)
 
 
 def _add_param_metadata(metadata: dict, key: str, value: Any) -> None:
@@ -393,7 +442,7 @@ def _add_param_metadata(metadata: dict, key: str, value: Any) -> None:
     if value is None:
         return
     try:
-        py_value = nij.ij.py.from_java(value)
+        py_value = _metadata_from_java(value)
         if isinstance(py_value, JavaMap):
             py_value = dict(py_value)
         elif isinstance(py_value, JavaSet):
@@ -412,7 +461,7 @@ def _add_scijava_metadata(
 ) -> Dict[str, Dict[str, Any]]:
     metadata = {}
     for input in unresolved_inputs:
-        key = nij.ij.py.from_java(input.getName())
+        key = str(input.getName())
         param_map = {}
         _add_param_metadata(param_map, "max", input.getMaximumValue())
         _add_param_metadata(param_map, "min", input.getMinimumValue())
@@ -427,7 +476,7 @@ def _add_scijava_metadata(
         if choices is not None and len(choices) > 0:
             _add_param_metadata(param_map, "choices", choices)
         # Convert supported SciJava styles to widget types.
-        widget_type = preferred_widget_for(input, type_hints[input.getName()])
+        widget_type = preferred_widget_for(input, type_hints[_python_param_name(key)])
         if widget_type is not None:
             _add_param_metadata(param_map, "widget_type", widget_type)
 
@@ -442,29 +491,34 @@ def _get_postprocessors():
     Returns the list of PostprocessorPlugins that should be used
     on SciJava Modules from napari-imagej
     """
-    # Discover all postprocessors
-    postprocessors = nij.ij.plugin().createInstancesOfType(jc.PostprocessorPlugin)
-
-    problematic_postprocessors = (
-        # HACK: This particular postprocessor is trying to create a Display
-        # for lots of different types. Some of those types (specifically
-        # ImgLabelings) make this guy throw Exceptions. We are going to ignore
-        # it until it behaves.
-        # (see https://github.com/imagej/imagej-common/issues/100 )
-        jc.DisplayPostprocessor,
-        # HACK: This postprocessor will display data within a SciJava Table.
-        # We want to display the data in napari, so we don't want to run this.
-        jc.ResultsPostprocessor,
-    )
-
-    itr = postprocessors.iterator()
-    while itr.hasNext():
-        postprocessor = itr.next()
-        if type(postprocessor) in problematic_postprocessors:
-            itr.remove()
+    # NB createInstances returns a new (mutable) list of new instances each call
+    return nij.ij.plugin().createInstances(_postprocessor_infos())
+
+
+@lru_cache(maxsize=None)
+def _postprocessor_infos() -> List["jc.PluginInfo"]:
+    """Returns the PluginInfos of all non-problematic PostprocessorPlugins."""
+    problematic_postprocessors = {
+        str(cls.class_.getName())
+        for cls in (
+            # HACK: This particular postprocessor is trying to create a Display
+            # for lots of different types. Some of those types (specifically
+            # ImgLabelings) make this guy throw Exceptions. We are going to ignore
+            # it until it behaves.
+            # (see https://github.com/imagej/imagej-common/issues/100 )
+            jc.DisplayPostprocessor,
+            # HACK: This postprocessor will display data within a SciJava Table.
+            # We want to display the data in napari, so we don't want to run this.
+            jc.ResultsPostprocessor,
+        )
+    }
 
-    # Return non-problematic postprocessors
-    return postprocessors
+    # Discover all non-problematic postprocessors
+    infos = jc.ArrayList()
+    for info in nij.ij.plugin().getPluginsOfType(jc.PostprocessorPlugin):
+        if str(info.getClassName()) not in problematic_postprocessors:
+            infos.add(info)
+    return infos
 
 
 def functionify_module_execution(
@@ -487,6 +541,8 @@ def functionify_module_execution(
         # Determine which inputs must be resolved by the user
         unresolved_inputs = _filter_unresolved_inputs(module, info.inputs())
         unresolved_inputs = _sink_optional_inputs(unresolved_inputs)
+        # NB input names are fixed, so fetch them once rather than every execution
+        input_names = [str(i.getName()) for i in unresolved_inputs]
 
         # Package the rest of the execution into a widget
         def module_execute(
@@ -504,8 +560,8 @@ def functionify_module_execution(
             # Create user input map
             resolved_java_args = nij.ij.py.jargs(*user_resolved_inputs)
             input_map = jc.HashMap()
-            for module_item, input in zip(unresolved_inputs, resolved_java_args):
-                input_map.put(module_item.getName(), input)
+            for name, input in zip(input_names, resolved_java_args):
+                input_map.put(name, input)
 
             # Create postprocessors
             postprocessors: "jc.ArrayList" = _get_postprocessors()
@@ -536,7 +592,7 @@ def functionify_module_execution(
         # Add metadata for widget creation
         _add_napari_metadata(module_execute, info, unresolved_inputs)
         magic_kwargs = _add_scijava_metadata(
-            unresolved_inputs, module_execute.__annotation__
+            unresolved_inputs, module_execute.__annotations__
         )
 
         return (module_execute, magic_kwargs)
@@ -639,12 +695,12 @@ class NapariPostProcessor(object):
         widget_outputs: List[Any]
         layer_outputs, widget_outputs = _pure_module_outputs(module, self.params)
         # log outputs
-        for layer in layer_outputs:
-            getLogger("napari-imagej").debug(
-                f"Result: ({type(layer).__name__}) {layer.name}"
-            )
-        for output in widget_outputs:
-            getLogger("napari-imagej").debug(f"Result: ({type(output[1])}) {output[0]}")
+        logger = getLogger("napari-imagej")
+        if logger.isEnabledFor(DEBUG):
+            for layer in layer_outputs:
+                logger.debug("Result: (%s) %s", type(layer).__name__, layer.name)
+            for output in widget_outputs:
+                logger.debug("Result: (%s) %s", type(output[1]), output[0])
 
         mutated_layers = _mutable_layers(
             self.params,
@@ -658,7 +714,7 @@ class NapariPostProcessor(object):
             "display_results_in_new_window",
         )
         if display_externally is not None and len(widget_outputs) > 0:
-            name = "Result: " + nij.ij.py.from_java(module.getInfo().getTitle())
+            name = "Result: " + str(module.getInfo().getTitle())
             self.output_handler(
                 {"data": widget_outputs, "name": name, "external": display_externally}
             )
@@ -675,5 +731,5 @@ class NapariPostProcessor(object):
 
         end_time = perf_counter()
         getLogger("napari-imagej").debug(
-            f"Computation completed in {end_time - self.start_time:0.4f} seconds"
+            "Computation completed in %0.4f seconds", end_time - self.start_time
         )
@@ -16,7 +16,8 @@ from napari_imagej.java import jc
 class NapariEventSubscriber(object):
     @JOverride
     def onEvent(self, event):
-        getLogger("napari-imagej").debug(str(event))
+        # NB defer the (JNI) toString call until we know the event will be logged
+        getLogger("napari-imagej").debug("%s", event)
 
     @JOverride
     def getEventClass(self):
@@ -2,6 +2,8 @@
 Helper functions for working with the SciJava event bus.
 """
 
+from functools import lru_cache
+
 
 def subscribe(ij, subscriber):
     # NB: We need to retain a reference to this object or GC will delete it.
@@ -20,6 +22,13 @@ def subscribers(ij, event_class):
 def _event_bus(ij):
     # HACK: Tap into the EventBus to obtain SciJava Module debug info.
     # See https://github.com/scijava/scijava-common/issues/452
-    event_bus_field = ij.event().getClass().getDeclaredField("eventBus")
+    event_service = ij.event()
+    return _event_bus_field(event_service.getClass()).get(event_service)
+
+
+@lru_cache(maxsize=None)
+def _event_bus_field(event_service_class):
+    # NB the reflective lookup only needs to be done once per EventService class
+    event_bus_field = event_service_class.getDeclaredField("eventBus")
     event_bus_field.setAccessible(True)
-    return event_bus_field.get(ij.event())
+    return event_bus_field
@@ -281,9 +281,9 @@ class ImageJInitializer(QThread):
         listener_arr = JArray(jc.SearchListener)(
             [NapariImageJSearchListener(self.widget.result_tree.model().process)]
         )
-        self.widget.result_tree.model()._searchOperation = nij.ij.get(
-            "org.scijava.search.SearchService"
-        ).search(listener_arr)
+        self.widget.result_tree.model()._searchOperation = nij.search_service.search(
+            listener_arr
+        )
         # Make sure that the search stops when we close napari
         # Otherwise the Java threads like to continue
         when_jvm_stops(self.widget.result_tree.model()._searchOperation.terminate)
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from imagej.images import _imglib2_types
 from jpype import JArray, JByte, JClass, JDouble, JFloat, JInt, JLong, JShort
 from magicgui.types import ChoicesType
 from magicgui.widgets import (
@@ -301,6 +300,10 @@ class MutableOutputWidget(Container):
         return "float64"
 
     def _dtype_choices(self) -> List:
+        # NB: PyImageJ is imported here, so that merely importing this module
+        # (as the type conversion machinery does) does not pay for it.
+        from imagej.images import _imglib2_types
+
         return [dtype(v) for v in set(_imglib2_types.values())]
 
     def create_new_image(self) -> None:
@@ -81,14 +81,19 @@ class ResultRunner(QWidget):
         Using SHIFT, the second-highest action is run.
         :param result: The selected SearchResult
         """
-        buttons: List[ActionButton] = self._buttons_for(result)
+        # NB we only need the actions here - no need to build their buttons
+        actions = python_actions_for(result, self.output_signal, self)
         # Run the first action UNLESS Shift is also pressed.
         # If so, run the second action
-        if len(buttons) > 0:
-            if len(buttons) > 1 and QApplication.keyboardModifiers() & Qt.ShiftModifier:
-                buttons[1].action()
+        # NB actions are (name, callable) pairs in priority order. For modules,
+        # index 0 is "Run" (modal execution) and index 1 is "Widget".
+        if len(actions) > 0:
+            if len(actions) > 1 and QApplication.keyboardModifiers() & Qt.ShiftModifier:
+                _, second_action = actions[1]
+                second_action()
             else:
-                buttons[0].action()
+                _, first_action = actions[0]
+                first_action()
 
     # -- HELPER FUNCTIONALITY -- #
 
@@ -28,7 +28,7 @@ from napari_imagej.widgets.widget_utils import _get_icon, python_actions_for
 if TYPE_CHECKING:
     from qtpy.QtCore import QModelIndex
 
-    from typing import Dict, List
+    from typing import Dict, List, Optional
 
 
 # Color used for additional information in the QTreeView
@@ -97,8 +97,11 @@ class SearcherItem(QStandardItem):
     def __init__(
         self,
         searcher: "jc.Searcher",
+        title: Optional[str] = None,
     ):
-        super().__init__(str(searcher.title()))
+        # NB a Searcher's title never changes, so we only convert it once
+        self.title = str(searcher.title()) if title is None else title
+        super().__init__(self.title)
         self.searcher = searcher
 
         # Finding the priority is tricky - Searchers don't know their priority
@@ -109,8 +112,8 @@ class SearcherItem(QStandardItem):
         # Set QtPy properties
         self.setEditable(False)
         self.setFlags(self.flags() | Qt.ItemIsUserCheckable)
-        checked = nij.ij.get("org.scijava.search.SearchService").enabled(searcher)
-        self.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        self.checked = bool(nij.search_service.enabled(searcher))
+        self.setCheckState(Qt.Checked if self.checked else Qt.Unchecked)
 
     def __lt__(self, other):
         """
@@ -121,17 +124,19 @@ class SearcherItem(QStandardItem):
 
 class SearchResultItem(QStandardItem):
     def __init__(self, result: "jc.SearchResult"):
-        props = result.properties()
         text = str(result.name())
         # Wrap up the icon path in "highlight text"
-        if "Menu path" in props:
-            text += f" <span style=\"color:{HIGHLIGHT};\">{props['Menu path']}</span>"
+        # NB a single lookup avoids a separate containsKey call into Java
+        if menu_path := result.properties().get("Menu path"):
+            text += f' <span style="color:{HIGHLIGHT};">{menu_path}</span>'
         super().__init__(text)
         self.result = result
 
         # Set QtPy properties
         self.setEditable(False)
-        if icon := _get_icon(str(result.iconPath()), result.getClass()):
+        # NB str(None) is "None", which _get_icon would try to load as a resource
+        icon_path = result.iconPath()
+        if icon_path and (icon := _get_icon(str(icon_path), result.getClass())):
             self.setIcon(icon)
 
 
@@ -186,7 +191,7 @@ class SearchResultModel(QStandardItemModel):
 
     def __init__(self):
         super().__init__()
-        self.searchers: Dict["jc.Searcher", SearcherItem] = {}
+        self.searchers: Dict[str, SearcherItem] = {}
         self.insert_searcher.connect(self.register_searcher)
         self.process.connect(self.handle_search_event)
 
@@ -199,9 +204,10 @@ class SearchResultModel(QStandardItemModel):
         self._searchOperation.search(text)
 
     def register_searcher(self, searcher: "jc.Searcher"):
-        if searcher not in self.searchers:
-            searcher_item: SearcherItem = SearcherItem(searcher)
-            self.searchers[str(searcher.title())] = searcher_item
+        title = str(searcher.title())
+        if title not in self.searchers:
+            searcher_item: SearcherItem = SearcherItem(searcher, title)
+            self.searchers[title] = searcher_item
             self.invisibleRootItem().appendRow(searcher_item)
 
     def handle_search_event(self, event: "jc.SearchEvent"):
@@ -216,7 +222,7 @@ class SearchResultModel(QStandardItemModel):
             searcher_item.appendRows(result_items)
             # Update title
         else:
-            getLogger("napari-imagej").debug(f"Searcher {event.searcher()} not found!")
+            getLogger("napari-imagej").debug("Searcher %s not found!", event.searcher())
 
     def first_search_result(self) -> "jc.SearchResult":
         root = self.invisibleRootItem()
@@ -234,17 +240,20 @@ class SearchResultModel(QStandardItemModel):
         if len(results) == 1:
             if str(results[0].name()) == "<error>":
                 getLogger("napari-imagej").debug(
-                    f"Failed Search: {str(results[0].properties().get(None))}"
+                    "Failed Search: %s", results[0].properties().get(None)
                 )
                 return []
-        return [SearchResultItem(r) for r in event.results()]
+        return [SearchResultItem(r) for r in results]
 
     def _detect_check_change(self, item):
         if isinstance(item, SearcherItem):
             checked = item.checkState() == Qt.Checked
-            nij.ij.get("org.scijava.search.SearchService").setEnabled(
-                item.searcher, checked
-            )
+            # NB itemChanged also fires for title updates (on every search),
+            # so only call into Java when the check state actually changed.
+            if checked == item.checked:
+                return
+            item.checked = checked
+            nij.search_service.setEnabled(item.searcher, checked)
             if not checked and item.hasChildren():
                 item.removeRows(0, item.rowCount())
 
@@ -252,10 +261,8 @@ class SearchResultModel(QStandardItemModel):
         item = self.itemFromIndex(parent_idx)
         if isinstance(item, SearcherItem):
             if item.hasChildren():
-                item.setData(
-                    # Write the number of results in "highlight text"
-                    f'{item.searcher.title()} <span style="color:{HIGHLIGHT};">({item.rowCount()})</span>',
-                    Qt.DisplayRole,
-                )
+                # Write the number of results in "highlight text"
+                count = f'<span style="color:{HIGHLIGHT};">({item.rowCount()})</span>'
+                item.setData(f"{item.title} {count}", Qt.DisplayRole)
             else:
-                item.setData(str(item.searcher.title()), Qt.DisplayRole)
+                item.setData(item.title, Qt.DisplayRole)
@@ -49,8 +49,7 @@ def python_actions_for(
 ):
     actions = []
     # Iterate over all available python actions
-    searchService = nij.ij.get("org.scijava.search.SearchService")
-    for action in searchService.actions(result):
+    for action in nij.search_service.actions(result):
         action_name = str(action.toString())
         # Add buttons for the java action
         if action_name == "Run":
@@ -70,7 +69,7 @@ def _run_actions_for(
         name = str(result.name())
         moduleInfo = info_for(result)
         if not moduleInfo:
-            getLogger("napari-imagej").debug(f"Search Result {result} cannot be run!")
+            getLogger("napari-imagej").debug("Search Result %s cannot be run!", result)
             return []
 
         if (
@@ -2,6 +2,8 @@
 A module testing napari-imagej settings
 """
 
+import os
+
 from scyjava import jimport
 
 from napari_imagej import settings
@@ -27,6 +29,19 @@ def test_validate_imagej_base_directory():
     assert errors[0].startswith("ImageJ base directory is not a valid directory.")
 
 
+def test_basedir_not_a_directory(tmp_path):
+    """
+    Assert that basedir falls back to the working directory given a non-directory.
+    """
+    a_file = tmp_path / "a-file"
+    a_file.write_text("")
+    settings.imagej_base_directory = str(a_file)
+    assert settings.basedir() == os.getcwd()
+
+    settings.imagej_base_directory = str(tmp_path)
+    assert settings.basedir() == str(tmp_path)
+
+
 def test_validate_enable_imagej_gui():
     """
     Assert that enable_imagej_gui=True on macOS is noticed by the validate function.
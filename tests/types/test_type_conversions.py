@@ -7,6 +7,7 @@ from typing import List
 import pytest
 from jpype import JObject
 
+from napari_imagej.types import type_conversions
 from napari_imagej.types.enum_likes import OutOfBoundsFactory
 from napari_imagej.types.type_hints import type_hints
 from napari_imagej.utilities import _module_utils
@@ -115,3 +116,36 @@ def test_enum():
 def test_shape():
     p_type = _module_utils.type_hint_for(DummyModuleItem(jtype=jc.Shape))
     assert p_type == JObject
+
+
+def test_type_hint_for_caching(monkeypatch):
+    # Count the number of times a type hint is actually resolved
+    resolutions = []
+
+    def counting_compute(module_item):
+        resolutions.append(module_item)
+        return compute(module_item)
+
+    compute = type_conversions._compute_type_hint
+    monkeypatch.setattr(type_conversions, "_TYPE_HINT_CACHE", {})
+    monkeypatch.setattr(type_conversions, "_compute_type_hint", counting_compute)
+
+    # Test that equivalent items are resolved only once
+    first = DummyModuleItem(name="a", jtype=jc.Shape)
+    second = DummyModuleItem(name="b", jtype=jc.Shape)
+    assert _module_utils.type_hint_for(first) is _module_utils.type_hint_for(second)
+    assert len(resolutions) == 1
+
+    # Test that items differing in requiredness are resolved separately
+    optional = DummyModuleItem(name="c", jtype=jc.Shape, isRequired=False)
+    _module_utils.type_hint_for(optional)
+    assert len(resolutions) == 2
+
+    # Test that failures are cached, and still raise
+    module_item = DummyModuleItem(
+        jtype=jc.OutOfBoundsFactory, isInput=True, isOutput=True
+    )
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            _module_utils.type_hint_for(module_item)
+    assert len(resolutions) == 3
@@ -174,6 +174,22 @@ def test_module_param():
     )
     assert expected == _module_utils._module_param(module_item)
 
+    # not required, Java default parameter
+    module_item = DummyModuleItem(
+        jtype=jc.String, name="foo", default=jc.String("bar"), isRequired=False
+    )
+    assert expected == _module_utils._module_param(module_item)
+    # NB JStrings compare equal to strs, so check the conversion directly
+    assert type(_module_utils._param_default_or_none(module_item)) is str
+
+    # not required, boxed Java number default parameter
+    module_item = DummyModuleItem(
+        jtype=jc.Integer, name="foo", default=jc.Integer(3), isRequired=False
+    )
+    default = _module_utils._param_default_or_none(module_item)
+    assert default == 3
+    assert type(default) is int
+
     # not required, non default parameter
     module_item = DummyModuleItem(jtype=jc.String, name="foo", isRequired=False)
     expected = Parameter(
@@ -209,6 +225,15 @@ def test_add_param_metadata():
     # If we cannot convert, it will not be inserted
     assert key not in metadata
 
+    # Test Java and Python strings
+    key = "label"
+    _module_utils._add_param_metadata(metadata, key, jc.String("foo"))
+    assert metadata[key] == "foo"
+    assert type(metadata[key]) is str
+    key = "widget_type"
+    _module_utils._add_param_metadata(metadata, key, "FloatSlider")
+    assert metadata[key] == "FloatSlider"
+
 
 @pytest.fixture
 def metadata_module_item(ij) -> DummyModuleItem:
@@ -338,6 +363,22 @@ def test_modify_functional_signature():
 
     # assert return annotation is str
     assert sig.return_annotation is str
+    # assert parameter positions are cached
+    assert func._param_index == {name: i for i, name in enumerate(sig_params)}
+
+
+def test_napari_specific_parameter():
+    def func(foo, bar):
+        pass
+
+    args = ("a", "b")
+    # Test functions without a cached index
+    assert _module_utils._napari_specific_parameter(func, args, "bar") == "b"
+    assert _module_utils._napari_specific_parameter(func, args, "baz") is None
+    # Test functions with a cached index
+    func._param_index = {"baz": 0}
+    assert _module_utils._napari_specific_parameter(func, args, "baz") == "a"
+    assert _module_utils._napari_specific_parameter(func, args, "bar") is None
 
 
 def run_module_from_script(ij, tmp_path, script, args):